@@ -1,18 +1,26 @@
 from .registrable import Registrable
-from .agent import Agent
+from .light_registrable import LightRegistrable
+from .agent import Agent, LightAgent
 from .object_registry import ObjectRegistry
-from .asset import Asset
+from .asset import Asset, LightAsset
 from .agent_perception import AgentPerception
 from .environment import Environment
 from .choice_set import ChoiceSet
+from .choice_set_numeric import NumericChoiceSet
+from .vectorized_agent_group import VectorizedAgentGroup
 
 
 __all__ = [
     "Registrable",
+    "LightRegistrable",
     "Agent",
+    "LightAgent",
     "ObjectRegistry",
     "Asset",
+    "LightAsset",
     "AgentPerception",
     "Environment",
     "ChoiceSet",
+    "NumericChoiceSet",
+    "VectorizedAgentGroup",
 ]
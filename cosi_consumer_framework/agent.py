@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import Any, TYPE_CHECKING
+from typing import Any, ClassVar, TYPE_CHECKING
 
+from .light_registrable import LightRegistrable
 from .registrable import Registrable
 
 if TYPE_CHECKING:
@@ -13,6 +14,13 @@ class Agent(Registrable, ABC):
     """An abstract base class for any object that can perform actions
     during a simulation step."""
 
+    # Agents that modify objects other than themselves while acting have to
+    # run in the main process if the environment runs in parallel.
+    requires_shared_state: ClassVar[bool] = False
+    # Agents whose `prepare` step does not modify any object and can run while
+    # other agents make their choices, e.g., because it waits for a database.
+    thread_safe: ClassVar[bool] = False
+
     def act(self, environment: "Environment") -> None:
         """Perform a step in the simulation. This contains of several steps:
         1. Perceive the environment to get the current state.
@@ -24,14 +32,32 @@ class Agent(Registrable, ABC):
             environment: The environment in which the household is located.
                 If not provided, the household's environment is used.
         """
+        options, perception = self.prepare(environment=environment)
+        # make choice based on the evaluation
+        self.choose(options=options, perception=perception)
+
+    def prepare(
+        self, environment: "Environment"
+    ) -> tuple["ChoiceSet", "AgentPerception"]:
+        """Perform the steps of `act` before the choice, i.e., perceive the
+        environment, trigger the choice set, and evaluate its options.
+
+        For agents with `thread_safe` set, the environment calls this method in
+        a thread pool and only makes the choices in the main thread.
+
+        Args:
+            environment: The environment in which the agent is located.
+
+        Returns:
+            The evaluated choice set and the perception of the agent.
+        """
         # get information from the environment
         perception = self.perceive(environment=environment)
         # trigger choice sets
         options = self.trigger_choice(perception=perception)
         # evaluate the choice set
         options.evaluate()
-        # make choice based on the evaluation
-        self.choose(options=options, perception=perception)
+        return options, perception
 
     @abstractmethod
     def perceive(self, environment: "Environment") -> "AgentPerception":
@@ -68,3 +94,20 @@ class Agent(Registrable, ABC):
             perception (AgentPerception): The agent's perception of the environment.
         """
         pass
+
+
+class LightAgent(LightRegistrable, ABC):
+    """Lightweight variant of Agent without pydantic validation, see
+    LightRegistrable. Subclasses implement the same abstract methods as for
+    Agent."""
+
+    __slots__ = ()
+
+    requires_shared_state: ClassVar[bool] = False
+    thread_safe: ClassVar[bool] = False
+
+    act = Agent.act
+    prepare = Agent.prepare
+    perceive = Agent.perceive
+    trigger_choice = Agent.trigger_choice
+    choose = Agent.choose
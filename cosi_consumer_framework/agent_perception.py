@@ -26,6 +26,28 @@ class AgentPerception(SQLModel, ABC):
 
     model_config = ConfigDict(extra="forbid", validate_assignment=True)  # type: ignore
 
+    def _set(self, **values: Any) -> None:
+        """Set several fields without validating the assignment.
+
+        Assigning a field (`self.x = value`) validates the value. In
+        `distort_information`, where the perception changes its own fields,
+        this helper can be used to skip the validation, e.g.,
+        `self._set(price=self.price * noise)`.
+
+        Args:
+            values: The new values by field name.
+
+        Raises:
+            AttributeError: If a name is not a field of the perception.
+        """
+        fields = type(self).model_fields
+        for name, value in values.items():
+            if name not in fields:
+                raise AttributeError(f"'{type(self).__name__}' has no field '{name}'.")
+            object.__setattr__(self, name, value)
+            # record the field as set, as an assignment would
+            self.__pydantic_fields_set__.add(name)
+
     @classmethod
     def perceive(cls, agent: Any, environment: "Environment") -> Any:
         """Create a perception from the environment.
@@ -66,7 +88,9 @@ class AgentPerception(SQLModel, ABC):
         """Distort the information in the perception.
 
         This method is used to distort the information in the perception.
-        It can be used to simulate noise in the perception of the agent.
+        It can be used to simulate noise in the perception of the agent. Use
+        `self._set(...)` to change many fields without validating each
+        assignment.
 
         Args:
             agent: The agent that is perceiving the environment.
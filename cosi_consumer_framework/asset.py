@@ -1,4 +1,5 @@
 from abc import ABC
+from .light_registrable import LightRegistrable
 from .registrable import Registrable
 
 
@@ -8,3 +9,10 @@ class Asset(Registrable, ABC):
     simulation, such as buildings, heating systems, or other components."""
 
     pass
+
+
+class LightAsset(LightRegistrable, ABC):
+    """Lightweight variant of Asset without pydantic validation, see
+    LightRegistrable."""
+
+    __slots__ = ()
@@ -0,0 +1,52 @@
+from abc import ABC
+
+import numpy as np
+from pydantic import ConfigDict, PrivateAttr
+
+from .choice_set import ChoiceSet
+
+
+class NumericChoiceSet(ChoiceSet, ABC):
+    """
+    A choice set whose options are described by numeric features. The utility
+    of an option is the weighted sum of its features, computed for all options
+    at once as a matrix-vector product.
+
+    Subclasses only implement the trigger function which creates the choice set
+    from the features of the available options and the agent's weights.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    features: np.ndarray  # shape (n_options, n_features)
+    weights: np.ndarray  # shape (n_features,)
+    _utilities: np.ndarray | None = PrivateAttr(default=None)
+
+    @property
+    def utilities(self) -> np.ndarray:
+        """The utilities of the options computed by the last evaluation."""
+        if self._utilities is None:
+            raise ValueError("The choice set has not been evaluated yet.")
+        return self._utilities
+
+    def evaluate(self) -> None:
+        """Evaluate the utilities of all options. The result is written into a
+        buffer that is reused as long as the number of options does not change.
+        """
+        dtype = np.result_type(self.features, self.weights)
+        n_options = self.features.shape[0]
+        if (
+            self._utilities is None
+            or self._utilities.shape[0] != n_options
+            or self._utilities.dtype != dtype
+        ):
+            self._utilities = np.empty(n_options, dtype=dtype)
+        np.matmul(self.features, self.weights, out=self._utilities)
+
+    def best_option(self) -> int:
+        """Get the index of the option with the highest utility.
+
+        Returns:
+            The index of the best option in the rows of the features.
+        """
+        return int(np.argmax(self.utilities))
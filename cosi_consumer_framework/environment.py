@@ -1,13 +1,52 @@
-from collections import defaultdict
-from typing import Any
-
-from .asset import Asset
-from .agent import Agent
-from .object_registry import ObjectRegistry
+import os
+import pickle
+import weakref
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import chain
+from types import MappingProxyType
+from typing import Any, Mapping
+
+import pandas as pd
+
+from .asset import Asset, LightAsset
+from .agent import Agent, LightAgent
+from .light_registrable import LightRegistrable
+from .object_registry import ObjectRegistry, flatten_objects
 from .registrable import Registrable
+from .report_buffer import ReportBuffer
+from .vectorized_agent_group import VectorizedAgentGroup
 
 __all__ = ["Environment"]
 
+_ASSET_TYPES = (Asset, LightAsset)
+_AGENT_TYPES = (Agent, LightAgent)
+
+
+# snapshot of the environment in a worker process with its step number, such
+# that the snapshot is only unpickled once per step and worker
+_worker_snapshot: tuple[int, "Environment"] | None = None
+
+
+def _act_in_worker(task: tuple[int, bytes, list[Agent]]) -> list[dict[str, Any]]:
+    """Let a chunk of agents act within a worker process.
+
+    Args:
+        task: The step number, the pickled year and assets of the environment,
+            and the agents to act.
+
+    Returns:
+        The state of each agent after acting.
+    """
+    global _worker_snapshot
+    step, data, agents = task
+    if _worker_snapshot is None or _worker_snapshot[0] != step:
+        year, assets = pickle.loads(data)
+        _worker_snapshot = (step, Environment._snapshot(year, assets))
+    environment = _worker_snapshot[1]
+    for a in agents:
+        a.act(environment=environment)
+    return [a.__getstate__() for a in agents]
+
 
 class Environment:
     """The environment in which households are embedded."""
@@ -15,27 +54,54 @@ class Environment:
     def __init__(
         self,
         year: int = 2020,
+        parallel: bool | int = False,
+        expected_steps: int | None = None,
     ):
         """Initialize the environment.
 
         Args:
             year: The year in which the simulation starts
                 default: 2020
+            parallel: Let agents act in worker processes. If True, one worker
+                per CPU core is used, an integer sets the number of workers.
+                Agents act on a read-only snapshot of the year and the assets,
+                agents with `requires_shared_state` always act in the main
+                process.
+                default: False
+            expected_steps: The expected number of reporting steps. If given,
+                space for the reports of all steps is reserved after the first
+                report of each class instead of growing the storage over time.
+                default: None
         """
         self._year = year
 
+        # number of worker processes, the pool is created on the first step
+        if parallel is True:
+            self._n_workers = os.cpu_count() or 1
+        else:
+            self._n_workers = int(parallel)
+        self._pool: ProcessPoolExecutor | None = None
+        # number of parallel steps, identifies the snapshot sent to the workers
+        self._n_parallel_steps = 0
+        # threads for the prepare step of thread-safe agents, created on demand
+        self._perceive_pool: ThreadPoolExecutor | None = None
+
         # single registry for all objects
-        self._object_registry: ObjectRegistry[Registrable] = ObjectRegistry()
+        self._object_registry: ObjectRegistry[Registrable | LightRegistrable] = (
+            ObjectRegistry()
+        )
 
-        # track classnames of agents and assets
-        self._agent_classnames: set[str] = set()
-        self._asset_classnames: set[str] = set()
+        # views on the registered agents and assets, maintained on add and delete
+        self._agents_view: dict[str, Agent] = {}
+        self._assets_view: dict[str, Asset] = {}
+        # groups of agents acting in a single vectorized call
+        self._groups: dict[str, VectorizedAgentGroup] = {}
 
         # reports are used to store the reports of the assets and agents for each
         # step of the simulation
-        # the report is stored as a dictionary with the object id as and a list
-        # of dictionaries containing the report data
-        self._reports: dict[str, list[dict[str, Any]]] = defaultdict(list)
+        # the reports are stored column-wise in one buffer per class name
+        self._reports: dict[str, ReportBuffer] = {}
+        self._expected_steps = expected_steps
 
     @property
     def year(self) -> int:
@@ -43,36 +109,56 @@ class Environment:
         return self._year
 
     @property
-    def assets(self) -> dict[str, Registrable]:
+    def assets(self) -> Mapping[str, Asset]:
         """Get all registered assets in the environment.
 
         Returns:
-            A dictionary with asset IDs as keys and asset objects as values.
+            A read-only mapping with asset IDs as keys and asset objects as values.
         """
-        assets = {}
-        for class_name in self._asset_classnames:
-            assets.update(self._object_registry._objects_by_class.get(class_name, {}))
-        return assets
+        return MappingProxyType(self._assets_view)
+
+    @property
+    def agents(self) -> Mapping[str, Agent]:
+        """Read-only mapping of all registered agents in the environment with
+        their IDs as keys."""
+        return MappingProxyType(self._agents_view)
 
     @property
-    def agents(self) -> dict[str, Registrable]:
-        """Dictionary of all registered agents in the environment with their
-        IDs as keys."""
-        agents = {}
-        for class_name in self._agent_classnames:
-            agents.update(self._object_registry._objects_by_class.get(class_name, {}))
-        return agents
+    def groups(self) -> Mapping[str, VectorizedAgentGroup]:
+        """Read-only mapping of all vectorized agent groups with their names
+        as keys."""
+        return MappingProxyType(self._groups)
 
     @property
     def reports(self) -> dict[str, list[dict[str, Any]]]:
         """Get the reports of all registered objects in the environment.
 
         Returns:
-            A dictionary with object IDs as keys and lists of dictionaries
+            A dictionary with class names as keys and lists of dictionaries
             containing the report data as values augmented by the current
-            year of the environment.
+            year of the environment. The lists are shared between calls and
+            only extended by new reports.
         """
-        return dict(self._reports)
+        return {
+            class_name: buffer.rows() for class_name, buffer in self._reports.items()
+        }
+
+    def reports_as_dataframe(self, class_name: str | type) -> pd.DataFrame:
+        """Get the reports of all objects of a class as a DataFrame.
+
+        Args:
+            class_name: The class name of the reporting objects.
+
+        Returns:
+            A DataFrame with one column per reported field and one row per
+            report. The DataFrame is empty if the class has not reported.
+        """
+        if isinstance(class_name, type):
+            class_name = class_name.__name__
+        buffer = self._reports.get(class_name)
+        if buffer is None:
+            return pd.DataFrame()
+        return buffer.to_dataframe()
 
     def add(
         self, objects: Asset | Agent | list[Asset | Agent] | list[list[Asset | Agent]]
@@ -83,33 +169,47 @@ class Environment:
             objects: A single object, list of objects, or nested list of objects to be registered.
                     Can be assets, agents, or a mix of both.
         """
-        # Flatten nested lists
-        if isinstance(objects, list) and objects and isinstance(objects[0], list):
-            flattened = []
-            for sublist in objects:
-                if isinstance(sublist, list):
-                    flattened.extend(sublist)
-            objects = flattened
-        elif not isinstance(objects, list):
-            objects = [objects]
-
-        for obj in objects:
-            if not isinstance(obj, (Asset, Agent)):
+        flat: list[Asset | Agent] = flatten_objects(objects)
+
+        # check all types before registering any object
+        asset_types = _ASSET_TYPES
+        registrable_types = _ASSET_TYPES + _AGENT_TYPES
+        for obj in flat:
+            if not isinstance(obj, registrable_types):
                 raise TypeError(
                     f"Expected Asset or Agent, got {type(obj).__name__} instead."
                 )
 
-            # check for dependencies
-            self._check_references(obj)
+        # check for dependencies, objects may reference objects added before
+        # them in the same call
+        pending: dict[str, Any] = {}
+        for obj in flat:
+            self._check_references(obj, pending)
+            pending[obj.id] = obj
+
+        # add to registry
+        self._object_registry.add(flat)
+
+        # update views
+        for obj in flat:
+            if isinstance(obj, asset_types):
+                self._assets_view[obj.id] = obj
+            else:
+                self._agents_view[obj.id] = obj
 
-            # add to registry
-            self._object_registry.add(obj)
+    def add_group(self, group: VectorizedAgentGroup) -> None:
+        """Register a vectorized agent group within the environment. Groups act
+        before the individual agents in each step.
 
-            # track classnames
-            if isinstance(obj, Asset):
-                self._asset_classnames.add(obj.__class__.__name__)
-            elif isinstance(obj, Agent):
-                self._agent_classnames.add(obj.__class__.__name__)
+        Args:
+            group: The group to be registered.
+
+        Raises:
+            ValueError: If a group with the same name is already registered.
+        """
+        if group.name in self._groups:
+            raise ValueError(f"Group with name '{group.name}' is already registered.")
+        self._groups[group.name] = group
 
     def delete(
         self, objects: Asset | Agent | list[Asset | Agent] | list[list[Asset | Agent]]
@@ -120,20 +220,11 @@ class Environment:
             objects: A single object, list of objects, or nested list of objects to be deleted.
                     Can be assets, agents, or a mix of both.
         """
-        # Flatten nested lists
-        objects_to_delete: list[Asset | Agent]
-        if isinstance(objects, list) and objects and isinstance(objects[0], list):
-            flattened: list[Agent | Asset] = []
-            for sublist in objects:
-                if isinstance(sublist, list):
-                    flattened.extend(sublist)
-            objects_to_delete = flattened
-        elif not isinstance(objects, list):
-            objects_to_delete = [objects]
-        else:
-            objects_to_delete = objects  # type: ignore
-
-        self._object_registry.delete(objects_to_delete)  # type: ignore
+        objects_to_delete = flatten_objects(objects)
+        for obj in objects_to_delete:
+            self._object_registry.delete(obj)  # type: ignore
+            self._assets_view.pop(obj.id, None)
+            self._agents_view.pop(obj.id, None)
 
     def get(self, id: str) -> Any:
         """Get an object (asset or agent) from the environment by ID.
@@ -167,31 +258,155 @@ class Environment:
             A list of all registered objects of the specified type.
         """
         if class_name is None:
-            return list(self.assets.values()) + list(self.agents.values())
+            return list(chain(self._assets_view.values(), self._agents_view.values()))
         return self._object_registry.list_objects(class_name)
 
     def step(self):
-        """Advance the environment by one year."""
-        for a in self.agents.values():
-            a.act(environment=self)
+        """Advance the environment by one year.
+
+        Vectorized agent groups act first. In a parallel environment, agents
+        without `requires_shared_state` then act in worker processes. All other
+        agents act in the main process in the order of their registration.
+        Thread-safe agents prepare their choices in a thread pool ahead of their
+        turn, i.e., their perception may not reflect the choices of agents
+        registered before them in the same step, but they choose in turn.
+        """
+        for group in self._groups.values():
+            group.act_vectorized(group.environment_state(self))
+
+        agents = list(self._agents_view.values())
+        if self._n_workers > 1:
+            self._act_parallel([a for a in agents if not a.requires_shared_state])
+            agents = [a for a in agents if a.requires_shared_state]
+        # agents overriding act cannot be split into prepare and choose
+        prepared = self._prepare_threaded(
+            [a for a in agents if a.thread_safe and type(a).act is Agent.act]
+        )
+        for a in agents:
+            future = prepared.get(a.id)
+            if future is None:
+                a.act(environment=self)
+            else:
+                options, perception = future.result()
+                a.choose(options=options, perception=perception)
         self.report()
 
         self._year += 1
 
-    def report(self) -> None:
-        # do the reporting
-        all_reporters: list[Registrable] = [
-            r for r in self.get_list() if r.is_reporting
-        ]
+    def __enter__(self) -> "Environment":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Shut down the worker processes of a parallel environment."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+        if self._perceive_pool is not None:
+            self._perceive_pool.shutdown()
+            self._perceive_pool = None
+
+    def _prepare_threaded(self, agents: list[Agent]) -> dict[str, Future]:
+        """Submit the prepare step of agents to a thread pool.
+
+        Args:
+            agents: Agents with `thread_safe` set.
+
+        Returns:
+            The futures of the options and perceptions by agent ID.
+        """
+        if not agents:
+            return {}
+        if self._perceive_pool is None:
+            self._perceive_pool = ThreadPoolExecutor(max_workers=os.cpu_count())
+        return {
+            a.id: self._perceive_pool.submit(a.prepare, environment=self)
+            for a in agents
+        }
+
+    def _act_parallel(self, agents: list[Agent]) -> None:
+        """Let agents act in worker processes and merge their new state back
+        into the registered objects.
+
+        Args:
+            agents: The agents to act. They must not modify other objects.
+        """
+        if not agents:
+            return
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self._n_workers)
+            # shut down the workers if the environment is never closed
+            weakref.finalize(self, self._pool.shutdown, wait=False)
+
+        # workers only read the year and the assets, which are pickled once per
+        # step; each chunk only carries its own agents
+        self._n_parallel_steps += 1
+        data = pickle.dumps(
+            (self._year, self._assets_view),
+            protocol=pickle.HIGHEST_PROTOCOL,
+        )
+        chunk_size = -(-len(agents) // self._n_workers)
+        chunks = [agents[i : i + chunk_size] for i in range(0, len(agents), chunk_size)]
+        tasks = [(self._n_parallel_steps, data, c) for c in chunks]
+        results = self._pool.map(_act_in_worker, tasks)
+        for chunk, states in zip(chunks, results):
+            for a, state in zip(chunk, states):
+                a.__setstate__(state)
+
+    @classmethod
+    def _snapshot(cls, year: int, assets: dict[str, Asset]) -> "Environment":
+        """Create the environment in which agents act in a worker process. It
+        only holds the assets, which are registered without further checks.
+
+        Args:
+            year: The current year of the simulation.
+            assets: The registered assets with their IDs as keys.
+        """
+        environment = cls(year=year)
+        environment._assets_view = assets
+        environment._object_registry._objects.update(assets)
+        by_class = environment._object_registry._objects_by_class
+        for id, asset in assets.items():
+            by_class.setdefault(asset._class_name_cache, {})[id] = asset
+        return environment
 
-        for a in all_reporters:
+    def report(self) -> None:
+        # do the reporting, iterating the views without building a list
+        year = self.year
+        reported_before = set(self._reports)
+        for a in chain(self._assets_view.values(), self._agents_view.values()):
+            if not a.is_reporting:
+                continue
             report = a.report()
             if report:
                 for k, r in report.items():
-                    r["year"] = self.year
-                    self._reports[k].append(r)
+                    r["year"] = year
+                    self._append_report(k, r)
+
+        # reserve space for all steps based on the first report of a class
+        if self._expected_steps is not None:
+            for class_name in self._reports.keys() - reported_before:
+                buffer = self._reports[class_name]
+                buffer.reserve(len(buffer) * self._expected_steps)
 
-    def _check_references(self, obj: Any) -> None:
+    def _append_report(self, class_name: str, report: dict[str, Any]) -> None:
+        """Append a report to the buffer of its class. Fields that are missing
+        in a report or in previous reports are filled with None.
+
+        Args:
+            class_name: The class name under which the report is stored.
+            report: The reported fields and their values.
+        """
+        buffer = self._reports.get(class_name)
+        if buffer is None:
+            buffer = self._reports[class_name] = ReportBuffer()
+        buffer.append(report)
+
+    def _check_references(
+        self, obj: Any, pending: dict[str, Any] | None = None
+    ) -> None:
         """Check if the object has references. For each reference, we check, whether
         the referenced object is registered in the environment.
 
@@ -205,22 +420,26 @@ class Environment:
 
         Args:
             obj: The object to check for dependencies.
+            pending: Objects that are about to be registered together with obj
+                and may be referenced by it.
         Raises:
             ValueError: If a dependency is not registered in the environment.
         """
-        # dependencies are identified by ending with _id
-        # go through all attributes of the object and check if they are registered
-        references = [
-            attr
-            for attr in obj.__dict__
-            if attr.endswith("_id") and not attr.startswith("_")
-        ]
-        for ref in references:
+        # dependencies are identified by ending with _id, the reference fields
+        # are collected once per class
+        reference_fields = obj.__class__._reference_fields
+        if not reference_fields:
+            return
+        objects = self._object_registry._objects
+        for ref in reference_fields:
             ref_id = getattr(obj, ref)
             # check whether the referenced object is registered
-            if not self._object_registry.object_is_registered(ref_id):
+            ref_obj = objects.get(ref_id)
+            if ref_obj is None and pending:
+                ref_obj = pending.get(ref_id)
+            if ref_obj is None or not ref_obj.is_active:
                 raise ValueError(
-                    f"Object '{obj.__class__.__name__}' with id '{obj.id}'"
+                    f"Object '{obj._class_name_cache}' with id '{obj.id}'"
                     f" has a reference '{ref}'  with id '{ref_id}' which is not"
                     " registered in the environment."
                 )
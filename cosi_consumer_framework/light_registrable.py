@@ -0,0 +1,116 @@
+from typing import Any, ClassVar
+
+
+class LightRegistrable:
+    """
+    A lightweight alternative to Registrable for large numbers of objects.
+
+    Instances store their attributes in `__slots__` instead of an instance
+    dictionary and are not pydantic models. Hence, apart from the uniqueness of
+    the ID, attributes are neither validated on creation nor on assignment.
+
+    Subclasses declare their attributes in `__slots__` and set them in their own
+    `__init__` after calling `super().__init__(id=...)`. All public attributes
+    are reported. As for Registrable, the id provided to the constructor is
+    automatically prefixed with the class name.
+    """
+
+    __slots__ = ("id", "_is_active", "is_reporting")
+
+    _used_ids: ClassVar[set[str]] = set()
+    # all slots, the reported attributes, and the attributes referencing other
+    # objects; collected along the class hierarchy in __init_subclass__
+    _slot_names: ClassVar[tuple[str, ...]] = __slots__
+    _report_fields: ClassVar[tuple[str, ...]] = ("id",)
+    _reference_fields: ClassVar[tuple[str, ...]] = ()
+    _class_name_cache: ClassVar[str] = "LightRegistrable"
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """
+        This method is called when a new subclass is created.
+        """
+        super().__init_subclass__(**kwargs)
+        cls._used_ids = set()
+        cls._class_name_cache = cls.__name__
+
+        slot_names: list[str] = []
+        for klass in reversed(cls.__mro__):
+            slots = klass.__dict__.get("__slots__", ())
+            if isinstance(slots, str):
+                slots = (slots,)
+            slot_names.extend(s for s in slots if s not in slot_names)
+        cls._slot_names = tuple(slot_names)
+        cls._report_fields = tuple(
+            s for s in slot_names if not s.startswith("_") and s != "is_reporting"
+        )
+        cls._reference_fields = tuple(
+            s for s in cls._report_fields if s.endswith("_id")
+        )
+
+    def __init__(self, id: str | int, is_reporting: bool = True) -> None:
+        if not isinstance(id, int) and not id.strip():
+            raise ValueError("id must be a non-empty string or integer.")
+
+        # convert id to qualified ID
+        qualified_id = f"{self._class_name_cache}.{id}"
+        if qualified_id in self._used_ids:
+            raise ValueError(
+                f"ID '{id}' is already in use and must be unique by class."
+            )
+        self._used_ids.add(qualified_id)
+
+        self.id = qualified_id
+        self._is_active = True
+        self.is_reporting = is_reporting
+
+    def __repr__(self) -> str:
+        attributes = ", ".join(
+            f"{f}={getattr(self, f, None)!r}" for f in self._report_fields
+        )
+        return f"{self._class_name_cache}({attributes})"
+
+    def __getstate__(self) -> dict[str, Any]:
+        return {s: getattr(self, s) for s in self._slot_names if hasattr(self, s)}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        for name, value in state.items():
+            setattr(self, name, value)
+
+    @property
+    def class_name(self) -> str:
+        """
+        Get the class name of the object.
+
+        Returns:
+            The class name as a string.
+        """
+        return self._class_name_cache
+
+    @property
+    def is_active(self) -> bool:
+        """
+        Check if the object is active.
+
+        Returns:
+            True if the object is active, False otherwise.
+        """
+        return self._is_active
+
+    def destroy(self):
+        """
+        Delete the object and remove its ID from the used IDs set.
+        """
+        self._used_ids.remove(self.id)
+        self._is_active = False
+
+    def report(self) -> dict[str, dict[str, Any]]:
+        """
+        Report the object as a dictionary.
+
+        Returns:
+            A dictionary with the key as the class name and the value as a
+            dictionary of the object's public attributes
+        """
+        return {
+            self._class_name_cache: {f: getattr(self, f) for f in self._report_fields}
+        }
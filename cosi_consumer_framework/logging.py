@@ -1,12 +1,26 @@
 import logging
+import os
 import sys
 
 
+def _has_target(handler: logging.Handler, filename: str | None) -> bool:
+    """Check whether a handler logs to the given file or, if no filename is
+    given, to stdout."""
+    if isinstance(handler, logging.FileHandler):
+        if filename is None:
+            return False
+        return handler.baseFilename == os.path.abspath(filename)
+    if isinstance(handler, logging.StreamHandler):
+        return filename is None and handler.stream is sys.stdout
+    return False
+
+
 def setup_logger(
     name: str, level: int = logging.INFO, filename: str | None = None
 ) -> logging.Logger:
     """
-    Sets up a logger that outputs to stdout or a file.
+    Sets up a logger that outputs to stdout or a file. Calling it again for the
+    same target only updates the level.
 
     Args:
         name (str): The name of the logger.
@@ -19,6 +33,12 @@ def setup_logger(
     logger = logging.getLogger(name)
     logger.setLevel(level)
 
+    # Keep an existing handler with the same target instead of creating a new one
+    for h in logger.handlers:
+        if _has_target(h, filename):
+            h.setLevel(level)
+            return logger
+
     # Remove existing handlers (to avoid duplicate logs)
     if logger.hasHandlers():
         logger.handlers.clear()
@@ -45,4 +65,6 @@ def setup_logger(
     return logger
 
 
-agent_logger = setup_logger("agent", level=logging.WARNING)
+# no output is configured on import, call setup_logger to attach a handler
+agent_logger = logging.getLogger("agent")
+agent_logger.addHandler(logging.NullHandler())
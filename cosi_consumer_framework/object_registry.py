@@ -1,10 +1,33 @@
-from collections import defaultdict
-from typing import Any, Generic, TypeVar
+from typing import Any, Generic, Sequence, TypeVar
 
 
+from .light_registrable import LightRegistrable
 from .registrable import Registrable
 
-T = TypeVar("T", bound=Registrable)
+T = TypeVar("T", bound=Registrable | LightRegistrable)
+
+
+def flatten_objects(objects: Any) -> list[Any]:
+    """Flatten an object or arbitrarily nested lists and tuples of objects into a
+    list of objects, keeping their order.
+
+    Args:
+        objects: The objects to flatten.
+
+    Returns:
+        The objects in a flat list.
+    """
+    if not isinstance(objects, (list, tuple)):
+        return [objects]
+    flat: list[Any] = []
+    stack = [objects]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, (list, tuple)):
+            stack.extend(reversed(item))
+        else:
+            flat.append(item)
+    return flat
 
 
 class ObjectRegistry(Generic[T]):
@@ -12,28 +35,30 @@ class ObjectRegistry(Generic[T]):
 
     def __init__(self) -> None:
         self._objects: dict[str, T] = {}
-        self._objects_by_class: dict[str, dict[str, T]] = defaultdict(defaultdict)
+        # index of the objects by class name, kept in sync with _objects
+        self._objects_by_class: dict[str, dict[str, T]] = {}
 
     @property
     def objects(self) -> dict[str, Any]:
         """Get all registered objects in the registry.
 
         Returns:
-            A dictionary with class names as keys and dictionaries of objects
-            as values.
+            A dictionary with object IDs as keys and objects as values.
         """
         return self._objects
 
-    def add(self, objects: T | list[T]) -> None:
-        """Register an object or a list of objects in the environment.
+    def add(self, objects: T | Sequence[T]) -> None:
+        """Register an object or a (nested) list of objects in the environment.
+
+        All objects are checked before any of them is registered.
 
         Args:
             objects: An object or a list of objects to be registered.
         """
-        if not isinstance(objects, list):
-            objects = [objects]
-        for obj in objects:
-            if not isinstance(obj, Registrable):
+        flat: list[T] = flatten_objects(objects)
+        new_objects: dict[str, T] = {}
+        for obj in flat:
+            if not isinstance(obj, (Registrable, LightRegistrable)):
                 raise TypeError(
                     "Object must be a subclass of Registrable and actively registered."
                 )
@@ -41,12 +66,20 @@ class ObjectRegistry(Generic[T]):
                 raise ValueError(
                     "Object must be a subclass of Registrable and actively registered."
                 )
-            # check if the object is already registered
-            if obj.id in self._objects:
+            # check if the object is given twice
+            if obj.id in new_objects:
                 raise ValueError(f"Object with id '{obj.id}' is already registered.")
-            # register the object
-            self._objects[obj.id] = obj
-            self._objects_by_class[obj.__class__.__name__][obj.id] = obj
+            new_objects[obj.id] = obj
+
+        # check if any object is already registered
+        if not self._objects.keys().isdisjoint(new_objects):
+            registered = next(i for i in new_objects if i in self._objects)
+            raise ValueError(f"Object with id '{registered}' is already registered.")
+
+        # register the objects
+        self._objects.update(new_objects)
+        for id, obj in new_objects.items():
+            self._objects_by_class.setdefault(obj._class_name_cache, {})[id] = obj
 
     def delete(self, objects: T | list[T]) -> None:
         """Delete an object or a list of objects from the registry.
@@ -61,17 +94,27 @@ class ObjectRegistry(Generic[T]):
                 del self._objects[obj.id]
             except KeyError:
                 raise KeyError(f"Object with id '{obj.id}' not found.")
-
-    def object_is_registered(self, object: Registrable | str) -> bool:
+            class_name = obj._class_name_cache
+            class_objects = self._objects_by_class[class_name]
+            del class_objects[obj.id]
+            if not class_objects:
+                del self._objects_by_class[class_name]
+
+    def object_is_registered(
+        self, object: Registrable | LightRegistrable | str
+    ) -> bool:
         """Check if an object is registered in the registry.
         Args:
             object: The object to check.
         """
-        if isinstance(object, Registrable):
-            key = object.id
-        else:
-            key = object
-        return key in self._objects and self._objects[key].is_active
+        if isinstance(object, str):
+            obj = self._objects.get(object)
+            return obj is not None and obj._is_active
+        id = getattr(object, "id", None)
+        if not isinstance(id, str):
+            return False
+        # the registered object must be the given one, not only share its id
+        return self._objects.get(id) is object and object._is_active
 
     def list_objects(self, class_name: str | type | None = None) -> list[Any]:
         """List all registered objects of a certain type.
@@ -90,7 +133,8 @@ class ObjectRegistry(Generic[T]):
             return list(self._objects.values())
         if isinstance(class_name, type):
             class_name = class_name.__name__
-        return list(self._objects_by_class[class_name].values())
+        # the index by class avoids scanning all objects
+        return list(self._objects_by_class.get(class_name, {}).values())
 
     def _get_class_name_from_id(self, id: str) -> str:
         """Extract class name and ID from a given id
@@ -101,10 +145,10 @@ class ObjectRegistry(Generic[T]):
         Returns:
             class_name: The class name extracted from the ID.
         """
-        res = id.split(".")
-        if len(res) < 2:
+        class_name, sep, _ = id.partition(".")
+        if not sep:
             raise ValueError("ID must be a qualified ID (e.g., 'ClassName.id').")
-        return res[0]
+        return class_name
 
     def get_item(self, id: str) -> T:
         """Get an item from the registry by class name and ID
@@ -114,8 +158,19 @@ class ObjectRegistry(Generic[T]):
 
         Returns:
             The object with the specified ID and class name.
+
+        Raises:
+            ValueError: If the ID is not a qualified ID, no object of its class
+                is registered, or no object has the ID.
         """
         res = self._objects.get(id)
-        if res is None:
-            raise ValueError(f"Object with ID '{id}' not found in the registry.")
-        return res
+        if res is not None:
+            return res
+        # the ID is only parsed to explain why no object was found
+        class_name, sep, _ = id.partition(".")
+        if not sep or class_name not in self._objects_by_class:
+            raise ValueError(
+                f"Object with ID '{id}' not found in the registry: unknown class or"
+                " malformed ID."
+            )
+        raise ValueError(f"Object with ID '{id}' not found in the registry.")
@@ -1,10 +1,92 @@
-from typing import ClassVar, Any
+from collections import Counter
+from types import NoneType, UnionType
+from typing import (
+    ClassVar,
+    Any,
+    Callable,
+    Iterable,
+    Union,
+    cast,
+    get_args,
+    get_origin,
+)
 import pandas as pd
 from pydantic import field_validator, PrivateAttr
 from sqlmodel import SQLModel
 from pydantic import ConfigDict, Field
 
 
+# field types that model_dump returns unchanged
+_PLAIN_TYPES = (int, float, str, bool, NoneType)
+
+
+# Python types of the values of numeric and boolean DataFrame columns by dtype kind
+_DTYPE_KIND_TYPES: dict[str, type] = {"b": bool, "i": int, "u": int, "f": float}
+
+
+def _plain_types(annotation: Any) -> set[type] | None:
+    """Get the types of a field annotation that only consists of plain types, or
+    None if it contains other types."""
+    if get_origin(annotation) in (Union, UnionType):
+        types: set[type] = set()
+        for arg in get_args(annotation):
+            arg_types = _plain_types(arg)
+            if arg_types is None:
+                return None
+            types |= arg_types
+        return types
+    return {annotation} if annotation in _PLAIN_TYPES else None
+
+
+def _is_plain_annotation(annotation: Any) -> bool:
+    """Check whether a field annotation only consists of plain types."""
+    return _plain_types(annotation) is not None
+
+
+def _column_has_types(column: pd.Series, types: set[type]) -> bool:
+    """Check whether all values of a column are of the given types, such that no
+    validation would convert them. NaN is only accepted for float types."""
+    kind = _DTYPE_KIND_TYPES.get(column.dtype.kind)
+    if kind is not None:
+        return kind in types
+    return set(map(type, column.tolist())) <= types
+
+
+def _build_report_method(cls: type["Registrable"]) -> Callable | None:
+    """Generate a report method that reads the fields of the class directly
+    instead of calling model_dump.
+
+    Args:
+        cls: The class to generate the report method for.
+
+    Returns:
+        The report method or None if model_dump may transform the fields or
+        dump other attributes, i.e., if the class has fields of other than plain
+        types, serializers, computed fields, or allows extra fields.
+    """
+    decorators = cls.__pydantic_decorators__
+    if (
+        decorators.field_serializers
+        or decorators.model_serializers
+        or cls.model_computed_fields
+        or cls.model_config.get("extra") == "allow"
+    ):
+        return None
+    fields = [f for f, info in cls.model_fields.items() if not info.exclude]
+    if not all(_is_plain_annotation(cls.model_fields[f].annotation) for f in fields):
+        return None
+
+    body = ", ".join(f"{f!r}: self.{f}" for f in fields)
+    source = f"def report(self):\n    return {{{cls.__name__!r}: {{{body}}}}}\n"
+    namespace: dict[str, Any] = {}
+    exec(source, namespace)
+    report = namespace["report"]
+    report.__doc__ = Registrable.report.__doc__
+    report.__qualname__ = f"{cls.__qualname__}.report"
+    report._generated = True
+    return report
+
+
 class Registrable(SQLModel):
     """
     A class that allows registration in the environment.
@@ -25,6 +107,9 @@ class Registrable(SQLModel):
         description="Flag to indicate if the object is reporting.",
     )
     _used_ids: ClassVar[set[str]]
+    _class_name_cache: ClassVar[str] = "Registrable"
+    # public fields ending with '_id' that reference other objects
+    _reference_fields: ClassVar[tuple[str, ...]] = ()
 
     def model_post_init(self, __context):
         self._used_ids.add(self.id)
@@ -36,6 +121,23 @@ class Registrable(SQLModel):
         super().__init_subclass__(**kwargs)
         # Attach a fresh, unique set for used IDs to each subclass.
         cls._used_ids = set()
+        cls._class_name_cache = cls.__name__
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        """
+        This method is called after pydantic has collected the fields of a new
+        subclass.
+        """
+        super().__pydantic_init_subclass__(**kwargs)
+        cls._reference_fields = tuple(
+            f for f in cls.model_fields if f.endswith("_id") and not f.startswith("_")
+        )
+
+        # replace the generic report by one generated for the fields of the
+        # class unless the report method is overridden
+        if cls.report is Registrable.report or getattr(cls.report, "_generated", False):
+            cls.report = _build_report_method(cls) or Registrable.report  # type: ignore
 
     @field_validator("id", mode="before")
     @classmethod
@@ -60,7 +162,7 @@ class Registrable(SQLModel):
         Returns:
             The class name as a string.
         """
-        return self.__class__.__name__
+        return self._class_name_cache
 
     @property
     def is_active(self) -> bool:
@@ -79,6 +181,38 @@ class Registrable(SQLModel):
         self._used_ids.remove(self.id)
         self._is_active = False
 
+    @classmethod
+    def destroy_many(cls, objects: Iterable["Registrable"]) -> None:
+        """
+        Destroy many objects at once, removing the IDs of each class from its used
+        IDs set in a single operation.
+
+        Either all objects are destroyed or, if any of them is destroyed already,
+        none.
+
+        Args:
+            objects: The objects to destroy, possibly of different classes.
+
+        Raises:
+            KeyError: If an object is destroyed already or given twice.
+        """
+        objects = list(objects)
+        ids_by_class: dict[type["Registrable"], list[str]] = {}
+        for obj in objects:
+            ids_by_class.setdefault(type(obj), []).append(obj.id)
+
+        for klass, ids in ids_by_class.items():
+            unique_ids = set(ids)
+            if len(unique_ids) < len(ids) or not unique_ids <= klass._used_ids:
+                raise KeyError(
+                    f"Objects of class '{klass.__name__}' are destroyed already or"
+                    " given twice."
+                )
+        for klass, ids in ids_by_class.items():
+            klass._used_ids.difference_update(ids)
+        for obj in objects:
+            obj._is_active = False
+
     def report(self) -> dict[str, dict[str, Any]]:
         """
         Report the object as a dictionary.
@@ -91,16 +225,108 @@ class Registrable(SQLModel):
         return report
 
     @classmethod
-    def create_from_dataframe(cls, df: pd.DataFrame) -> list["Registrable"]:
+    def bulk_register_ids(cls, ids: Iterable[str | int]) -> list[str]:
+        """
+        Register many IDs at once, e.g., before creating instances with
+        `model_construct`, which skips the validation of the ID.
+
+        Either all IDs are registered or, if any of them is invalid, none.
+
+        Args:
+            ids: The IDs to register, not yet prefixed with the class name.
+
+        Returns:
+            The qualified IDs in the order of the input.
+
+        Raises:
+            ValueError: If an ID is empty, duplicated, or already in use.
+        """
+        qualified = []
+        for v in ids:
+            if not isinstance(v, int) and not v.strip():
+                raise ValueError("id must be a non-empty string or integer.")
+            qualified.append(f"{cls.__name__}.{v}")
+
+        new_ids = set(qualified)
+        overlap = cls._used_ids.intersection(new_ids)
+        if len(new_ids) < len(qualified):
+            overlap.update(i for i, n in Counter(qualified).items() if n > 1)
+        if overlap:
+            raise ValueError(
+                f"IDs {sorted(overlap)} are already in use or duplicated and must"
+                " be unique by class."
+            )
+        cls._used_ids.update(new_ids)
+        return qualified
+
+    @classmethod
+    def create_from_dataframe(
+        cls, df: pd.DataFrame, validate: bool = False
+    ) -> list["Registrable"]:
         """
         Create an instance of the class from a DataFrame.
 
+        Each row is validated by the model unless validating would only check
+        the uniqueness of the IDs, i.e., the model has no validators or field
+        constraints, all columns are fields, all required fields are given, and
+        all values are of the plain types of their fields. Then the IDs of all
+        rows are checked at once and the instances are created with
+        `model_construct`. Field constraints and validators are never skipped.
+        Either instances are created for all rows or, if any row is invalid,
+        none.
+
         Args:
             df: A DataFrame containing the data to create the instance.
+            validate: If True, each row is validated by the model even if the
+                validation is trivial.
+                default: False
 
         Returns:
             List of instances of the class created from the DataFrame.
         """
         df.columns = df.columns.map(str)
-        instances = [cls(**row) for row in df.to_dict(orient="records")]  # type: ignore
+        rows = cast(list[dict[str, Any]], df.to_dict(orient="records"))
+        if validate or not cls._columns_match_fields(df):
+            instances = []
+            try:
+                for row in rows:
+                    instances.append(cls(**row))
+            except ValueError:
+                # release the IDs of the rows created before the invalid one
+                cls.destroy_many(instances)
+                raise
+            return instances
+
+        ids = cls.bulk_register_ids(df["id"].tolist())
+        instances = []
+        for row, id_ in zip(rows, ids):
+            row["id"] = id_
+            instances.append(cls.model_construct(**row))
         return instances
+
+    @classmethod
+    def _columns_match_fields(cls, df: pd.DataFrame) -> bool:
+        """Check if the columns of a DataFrame can be used to construct instances
+        without validation, i.e., the model has no validators or constraints
+        apart from the uniqueness of the ID, all columns are fields, all required
+        fields are given, and all values are of the plain types of their fields."""
+        decorators = cls.__pydantic_decorators__
+        if set(decorators.field_validators) - {"_validate_id_uniqueness"}:
+            return False
+        if decorators.model_validators:
+            return False
+        fields = cls.model_fields
+        if any(info.metadata for info in fields.values()):
+            return False
+        if not set(df.columns).issubset(fields):
+            return False
+        if not all(f in df.columns for f, info in fields.items() if info.is_required()):
+            return False
+        for name in df.columns:
+            # IDs are checked when they are registered
+            types = (
+                {str, int} if name == "id" else _plain_types(fields[name].annotation)
+            )
+            if types is None or not _column_has_types(df[name], types):
+                return False
+        return True
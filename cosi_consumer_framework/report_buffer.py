@@ -0,0 +1,157 @@
+from typing import Any, cast
+
+import numpy as np
+import pandas as pd
+
+# Python types of reported values that are stored in arrays
+_ARRAY_DTYPES: dict[type, type] = {bool: np.bool_, int: np.int64, float: np.float64}
+
+
+class ReportBuffer:
+    """Column-wise storage of the reports of one class.
+
+    Columns whose values are all booleans, integers, or floats are stored in
+    NumPy arrays with spare capacity, all other columns in lists. If a value
+    does not fit the type of its array column, e.g., None for a missing field,
+    the column is converted to a list. Fields missing in a report are filled
+    with None.
+    """
+
+    def __init__(self, capacity: int = 16) -> None:
+        """Initialize the buffer.
+
+        Args:
+            capacity: The number of reports to reserve space for.
+                default: 16
+        """
+        self._capacity = max(capacity, 1)
+        self._n_reports = 0
+        self._columns: dict[str, np.ndarray | list[Any]] = {}
+        # Python type of the values in each array column
+        self._kinds: dict[str, type] = {}
+        # reports as dictionaries, extended on demand by rows() and rebuilt
+        # if a field was added since
+        self._rows: list[dict[str, Any]] = []
+        self._row_fields: tuple[str, ...] = ()
+
+    def __len__(self) -> int:
+        """The number of stored reports."""
+        return self._n_reports
+
+    def reserve(self, capacity: int) -> None:
+        """Reserve space for a number of reports in all array columns.
+
+        Args:
+            capacity: The total number of reports to reserve space for.
+        """
+        if capacity <= self._capacity:
+            return
+        self._capacity = capacity
+        for field in self._kinds:
+            column = cast(np.ndarray, self._columns[field])
+            resized = np.empty(capacity, dtype=column.dtype)
+            resized[: self._n_reports] = column[: self._n_reports]
+            self._columns[field] = resized
+
+    def append(self, report: dict[str, Any]) -> None:
+        """Append a report.
+
+        Args:
+            report: The reported fields and their values.
+        """
+        n = self._n_reports
+        if n == self._capacity:
+            self.reserve(2 * self._capacity)
+
+        columns = self._columns
+        kinds = self._kinds
+        for field, value in report.items():
+            column = columns.get(field)
+            if column is None:
+                column = self._add_column(field, value)
+            kind = kinds.get(field)
+            if kind is None:
+                column.append(value)  # type: ignore[union-attr]
+                continue
+            if type(value) is kind:
+                try:
+                    column[n] = value
+                    continue
+                except OverflowError:
+                    pass
+            self._to_list(field).append(value)
+
+        if len(columns) > len(report):
+            for field in columns:
+                if field not in report:
+                    column = columns[field]
+                    if field in kinds:
+                        column = self._to_list(field)
+                    column.append(None)  # type: ignore[union-attr]
+        self._n_reports = n + 1
+
+    def columns(self) -> dict[str, np.ndarray | list[Any]]:
+        """Get the stored reports column-wise.
+
+        Returns:
+            A dictionary mapping the fields to the reported values. Array
+            columns are views on the buffer.
+        """
+        return {
+            field: column[: self._n_reports] if field in self._kinds else column
+            for field, column in self._columns.items()
+        }
+
+    def rows(self) -> list[dict[str, Any]]:
+        """Get the stored reports as a list of dictionaries.
+
+        Only the reports appended since the last call are converted, the list
+        is shared between calls and must not be modified.
+
+        Returns:
+            One dictionary per report.
+        """
+        fields = tuple(self._columns)
+        if fields != self._row_fields:
+            self._rows = []
+            self._row_fields = fields
+        start = len(self._rows)
+        if start < self._n_reports:
+            values = [
+                c[start : self._n_reports].tolist()  # type: ignore[union-attr]
+                if field in self._kinds
+                else c[start : self._n_reports]
+                for field, c in self._columns.items()
+            ]
+            self._rows.extend(dict(zip(fields, row)) for row in zip(*values))
+        return self._rows
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """Get the stored reports as a DataFrame.
+
+        Returns:
+            A DataFrame with one column per field and one row per report. The
+            values are copied, i.e., modifying the DataFrame does not change
+            the stored reports.
+        """
+        return pd.DataFrame(self.columns(), copy=True)
+
+    def _add_column(self, field: str, value: Any) -> np.ndarray | list[Any]:
+        """Add a column for a new field. The column is an array if the field is
+        present from the first report and its value is a boolean or a number."""
+        kind = type(value)
+        column: np.ndarray | list[Any]
+        if self._n_reports == 0 and kind in _ARRAY_DTYPES:
+            column = np.empty(self._capacity, dtype=_ARRAY_DTYPES[kind])
+            self._kinds[field] = kind
+        else:
+            column = [None] * self._n_reports
+        self._columns[field] = column
+        return column
+
+    def _to_list(self, field: str) -> list[Any]:
+        """Convert an array column to a list column."""
+        del self._kinds[field]
+        column = self._columns[field][: self._n_reports].tolist()  # type: ignore
+        self._columns[field] = column
+        return column
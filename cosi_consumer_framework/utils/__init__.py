@@ -1,3 +1,3 @@
-from .discounting import discounted_sum
+from .discounting import discounted_sum, discounted_sum_array
 
-__all__ = ["discounted_sum"]
+__all__ = ["discounted_sum", "discounted_sum_array"]
@@ -1,13 +1,42 @@
-def discounted_sum(values: list[int | float], delta: float, initial_period: int = 0):
+import numpy as np
+
+# below this length, the pure Python sum is faster than converting to an array
+_MIN_ARRAY_LENGTH = 32
+
+
+def discounted_sum(
+    values: list[int | float] | np.ndarray, delta: float, initial_period: int = 0
+):
     """Calculated the discounted sum of a list of numbers.
 
     Args:
-        values: The list of numbers to be discounted
+        values: The list or array of numbers to be discounted
         delta: The discount factor
         initial_period: The initial period of the list
             default: 0
     """
+    if isinstance(values, np.ndarray):
+        return discounted_sum_array(values, delta, initial_period)
+    if len(values) >= _MIN_ARRAY_LENGTH:
+        return discounted_sum_array(
+            np.asarray(values, dtype=np.float64), delta, initial_period
+        )
     discounted_values = [
         values[i] * delta ** (i + initial_period) for i in range(len(values))
     ]
     return sum(discounted_values)
+
+
+def discounted_sum_array(
+    values: np.ndarray, delta: float, initial_period: int = 0
+) -> float:
+    """Calculated the discounted sum of an array of numbers.
+
+    Args:
+        values: One-dimensional array of numbers to be discounted
+        delta: The discount factor
+        initial_period: The initial period of the array
+            default: 0
+    """
+    periods = np.arange(initial_period, initial_period + len(values), dtype=np.float64)
+    return float(values @ np.power(delta, periods))
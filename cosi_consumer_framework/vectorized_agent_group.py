@@ -0,0 +1,76 @@
+from typing import Any, Callable, Mapping, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .environment import Environment  # pragma: no cover
+
+
+StepFunction = Callable[[dict[str, Any], Any], tuple[dict[str, Any], Any]]
+
+
+def default_environment_state(environment: "Environment") -> dict[str, Any]:
+    """Environment state passed to the step function if no other is defined.
+
+    Args:
+        environment: The environment in which the group acts.
+
+    Returns:
+        A dictionary with the current year.
+    """
+    return {"year": environment.year}
+
+
+class VectorizedAgentGroup:
+    """A group of homogeneous agents that act together in a single call.
+
+    Instead of one object per agent, the state of all agents is stored
+    column-wise: a dictionary maps each attribute to an array with one entry per
+    agent. In every step of the environment, the group calls the step function
+    once for the whole population. The step function takes the state and the
+    environment state and returns the new state and the choices of the agents,
+    i.e., it replaces the perceive, trigger, evaluate, and choose steps of the
+    individual agents.
+
+    The group does not depend on a specific array library. The step function
+    can use NumPy or, e.g., be compiled with `jax.jit` and vectorized over the
+    agents with `jax.vmap`, in which case the state should hold JAX arrays.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        state: Mapping[str, Any],
+        step_fn: StepFunction,
+        environment_state: Callable[["Environment"], Any] = default_environment_state,
+    ) -> None:
+        """Initialize the group.
+
+        Args:
+            name: The name of the group, unique within an environment.
+            state: Arrays with one entry per agent for each attribute.
+            step_fn: Function mapping the state and the environment state to the
+                new state and the choices of the agents.
+            environment_state: Function extracting the information the step
+                function needs from the environment.
+                default: the current year
+        """
+        lengths = {len(v) for v in state.values()}
+        if len(lengths) > 1:
+            raise ValueError("All state arrays must have one entry per agent.")
+        self.name = name
+        self.state: dict[str, Any] = dict(state)
+        self.step_fn = step_fn
+        self.environment_state = environment_state
+        self.choices: Any = None
+
+    def __len__(self) -> int:
+        """The number of agents in the group."""
+        return len(next(iter(self.state.values()), ()))
+
+    def act_vectorized(self, environment_state: Any) -> None:
+        """Let all agents of the group act by calling the step function once.
+
+        Args:
+            environment_state: The information the step function needs from the
+                environment.
+        """
+        self.state, self.choices = self.step_fn(self.state, environment_state)
@@ -47,6 +47,25 @@ def asset_list():
         obj.destroy()
 
 
+# The pools are created once per test module and shared by its tests. They must
+# only be used by tests that do not modify or destroy the objects; use
+# asset_list and agent_list otherwise.
+@pytest.fixture(scope="module")
+def asset_pool():
+    obj_list = [SampleAsset(id=f"pool_obj{i}") for i in range(3)]
+    yield obj_list
+    for obj in obj_list:
+        obj.destroy()
+
+
+@pytest.fixture(scope="module")
+def agent_pool():
+    agent_list = [SampleAgent(id=f"pool_agent{i}") for i in range(3)]
+    yield agent_list
+    for agent in agent_list:
+        agent.destroy()
+
+
 @pytest.fixture(scope="function")
 def agent_list():
     agent_list = [SampleAgent(id=f"agent{i}") for i in range(3)]
@@ -0,0 +1,38 @@
+import pytest
+
+from cosi_consumer_framework import AgentPerception
+
+
+class PricePerception(AgentPerception):
+    price: float
+    quantity: int
+    discount: float = 0.0
+
+    @classmethod
+    def get_information_from_environment(cls, agent, environment):
+        return {"price": 2.0, "quantity": 3}
+
+    def distort_information(self, agent):
+        self._set(price=self.price * 2, quantity=self.quantity + 1)
+
+
+def test_set_without_validation():
+    perception = PricePerception.perceive(agent=None, environment=None)
+    assert perception.price == 4.0
+    assert perception.quantity == 4
+
+    with pytest.raises(AttributeError):
+        perception._set(unknown=1)
+
+
+def test_set_marks_fields_as_set():
+    perception = PricePerception(price=1.0, quantity=1)
+    assigned = PricePerception(price=1.0, quantity=1)
+    assert "discount" not in perception.model_fields_set
+
+    perception._set(discount=0.5)
+    assigned.discount = 0.5
+    assert perception.model_fields_set == assigned.model_fields_set
+    assert perception.model_dump(exclude_unset=True) == assigned.model_dump(
+        exclude_unset=True
+    )
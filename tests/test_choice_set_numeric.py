@@ -0,0 +1,29 @@
+import numpy as np
+import pytest
+
+from cosi_consumer_framework import NumericChoiceSet
+
+
+class SampleNumericChoiceSet(NumericChoiceSet):
+    @classmethod
+    def trigger(cls, agent, perception):
+        return cls(features=perception["features"], weights=agent["weights"])
+
+
+def test_numeric_choice_set():
+    choice_set = SampleNumericChoiceSet.trigger(
+        agent={"weights": np.array([1.0, -0.5])},
+        perception={"features": np.array([[1.0, 2.0], [3.0, 1.0], [2.0, 0.0]])},
+    )
+    with pytest.raises(ValueError):
+        choice_set.utilities
+    choice_set.evaluate()
+    np.testing.assert_allclose(choice_set.utilities, [0.0, 2.5, 2.0])
+    assert choice_set.best_option() == 1
+
+    # the buffer is reused for the same number of options
+    buffer = choice_set.utilities
+    choice_set.weights = np.array([0.0, 1.0])
+    choice_set.evaluate()
+    assert choice_set.utilities is buffer
+    assert choice_set.best_option() == 0
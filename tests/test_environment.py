@@ -1,7 +1,31 @@
+import os
+import threading
+from typing import ClassVar
+
 import pytest
 
 from cosi_consumer_framework import Asset, Environment
-from .conftest import SampleAgent, SampleAsset
+from .conftest import SampleAgent, SampleAsset, SampleChoiceSet
+
+
+class ProcessAgent(SampleAgent):
+    """Agent remembering the process it acted in. Defined on module
+    level to be picklable for parallel environments."""
+
+    pid: int = 0
+    n_acts: int = 0
+    seen_year: int = 0
+    seen_assets: int = 0
+
+    def act(self, environment: Environment):
+        self.pid = os.getpid()
+        self.n_acts += 1
+        self.seen_year = environment.year
+        self.seen_assets = len(environment.get_list(SampleAsset))
+
+
+class SharedProcessAgent(ProcessAgent):
+    requires_shared_state: ClassVar[bool] = True
 
 
 def test_dependency_check():
@@ -111,6 +135,31 @@ def test_agent_dependency():
     house.destroy()
 
 
+def test_dependency_in_same_call():
+    """Test that objects can reference objects added before them in the same call."""
+    env = Environment()
+
+    class House(Asset):
+        pass
+
+    class Household(SampleAgent):
+        house_id: str
+
+    house = House(id="house1")
+    household = Household(id="household1", house_id=house.id)
+    # fails as the house is added after the household
+    with pytest.raises(ValueError):
+        env.add([household, house])
+    assert not env.is_in(house)
+
+    env.add([house, household])
+    assert env.is_in(household)
+
+    # clean up
+    household.destroy()
+    house.destroy()
+
+
 def test_add_twice(agent1: SampleAgent):
     """Test that adding the same agent twice raises an error."""
     id_ = agent1.id.split(".")[-1]
@@ -118,14 +167,39 @@ def test_add_twice(agent1: SampleAgent):
         SampleAgent(id=id_)
 
 
-def test_get_list(asset_list: list[SampleAsset]):
+def test_get_list(asset_pool: list[SampleAsset]):
     """Test that the get_asset_list method returns the correct assets."""
     env = Environment()
-    env.add(asset_list)
-    assert env.get_list(SampleAsset) == asset_list
-    assert env.get_list("SampleAsset") == asset_list
+    env.add(asset_pool)
+    assert env.get_list(SampleAsset) == asset_pool
+    assert env.get_list("SampleAsset") == asset_pool
     # also get it without filter as the only registered assets
-    assert env.get_list() == asset_list
+    assert env.get_list() == asset_pool
+
+
+def test_get_list_follows_changes(asset1: SampleAsset, agent1: SampleAgent):
+    """Test that the list of all objects follows additions and deletions."""
+    env = Environment()
+    env.add(agent1)
+    objects = env.get_list()
+    objects.append(asset1)
+    assert env.get_list() == [agent1]
+
+    env.add(asset1)
+    assert env.get_list() == [asset1, agent1]
+    env.delete(agent1)
+    assert env.get_list() == [asset1]
+
+
+def test_get_list_after_failed_delete(asset1: SampleAsset, asset2: SampleAsset):
+    """Test that the list of all objects follows a partially failed deletion."""
+    env = Environment()
+    env.add(asset1)
+    assert env.get_list() == [asset1]
+    with pytest.raises(KeyError):
+        env.delete([asset1, asset2])
+    assert not env.is_in(asset1)
+    assert env.get_list() == []
 
 
 def test_get_list_empty():
@@ -165,6 +239,46 @@ def test_reporting(asset1: SampleAsset, agent1: SampleAgent):
     assert asset1.class_name not in env.reports
 
 
+def test_reports_as_dataframe(asset_pool: list[SampleAsset]):
+    """Test that reports are available column-wise as a DataFrame."""
+    env = Environment(year=2020)
+    env.add(asset_pool)
+    env.step()
+    env.step()
+
+    df = env.reports_as_dataframe(SampleAsset)
+    assert len(df) == 2 * len(asset_pool)
+    assert list(df.columns) == ["id", "year"]
+    assert df["year"].tolist() == [2020] * 3 + [2021] * 3
+    assert env.reports_as_dataframe("Unknown").empty
+    assert env.reports[SampleAsset.__name__][0] == {
+        "id": asset_pool[0].id,
+        "year": 2020,
+    }
+
+
+def test_reports_expected_steps(asset_pool: list[SampleAsset]):
+    """Test that space for the expected steps is reserved after the first report."""
+    env = Environment(year=2020, expected_steps=10)
+    env.add(asset_pool)
+    env.step()
+    assert env._reports[SampleAsset.__name__]._capacity == 10 * len(asset_pool)
+    env.step()
+    years = env.reports_as_dataframe(SampleAsset)["year"].tolist()
+    assert years == [2020] * 3 + [2021] * 3
+
+
+def test_report_missing_fields():
+    """Test that fields missing in some reports are filled with None."""
+    env = Environment(year=2020)
+    env._append_report("Foo", {"a": 1, "year": 2020})
+    env._append_report("Foo", {"b": 2, "year": 2021})
+    assert env.reports["Foo"] == [
+        {"a": 1, "year": 2020, "b": None},
+        {"a": None, "year": 2021, "b": 2},
+    ]
+
+
 def test_step():
     """Test that the step method works correctly."""
     env = Environment(year=2020)
@@ -204,27 +318,27 @@ def test_delete_single_agent(agent1: SampleAgent):
     assert not env.is_in(agent1)
 
 
-def test_delete_asset_list(asset_list: list[SampleAsset]):
+def test_delete_asset_list(asset_pool: list[SampleAsset]):
     """Test that a list of assets can be deleted using the delete method."""
     env = Environment()
-    env.add(asset_list)
-    for asset in asset_list:
+    env.add(asset_pool)
+    for asset in asset_pool:
         assert env.is_in(asset)
 
-    env.delete(asset_list)
-    for asset in asset_list:
+    env.delete(asset_pool)
+    for asset in asset_pool:
         assert not env.is_in(asset)
 
 
-def test_delete_agent_list(agent_list: list[SampleAgent]):
+def test_delete_agent_list(agent_pool: list[SampleAgent]):
     """Test that a list of agents can be deleted using the delete method."""
     env = Environment()
-    env.add(agent_list)
-    for agent in agent_list:
+    env.add(agent_pool)
+    for agent in agent_pool:
         assert env.is_in(agent)
 
-    env.delete(agent_list)
-    for agent in agent_list:
+    env.delete(agent_pool)
+    for agent in agent_pool:
         assert not env.is_in(agent)
 
 
@@ -241,26 +355,38 @@ def test_delete_mixed_objects(asset1: SampleAsset, agent1: SampleAgent):
 
 
 def test_delete_mixed_object_list(
-    asset_list: list[SampleAsset], agent_list: list[SampleAgent]
+    asset_pool: list[SampleAsset], agent_pool: list[SampleAgent]
 ):
     """Test that mixed lists of assets and agents can be deleted together using the delete method."""
     env = Environment()
-    mixed_objects = asset_list + agent_list
+    mixed_objects = asset_pool + agent_pool
     env.add(mixed_objects)
 
-    for asset in asset_list:
+    for asset in asset_pool:
         assert env.is_in(asset)
-    for agent in agent_list:
+    for agent in agent_pool:
         assert env.is_in(agent)
 
     env.delete(mixed_objects)
 
-    for asset in asset_list:
+    for asset in asset_pool:
         assert not env.is_in(asset)
-    for agent in agent_list:
+    for agent in agent_pool:
         assert not env.is_in(agent)
 
 
+def test_agents_and_assets_views(asset1: SampleAsset, agent1: SampleAgent):
+    """Test that the agents and assets views follow additions and deletions."""
+    env = Environment()
+    env.add([asset1, agent1])
+    assert dict(env.assets) == {asset1.id: asset1}
+    assert dict(env.agents) == {agent1.id: agent1}
+
+    env.delete([asset1, agent1])
+    assert len(env.assets) == 0
+    assert len(env.agents) == 0
+
+
 def test_delete_non_existent_object():
     """Test that deleting a non-existent object raises a KeyError."""
     env = Environment()
@@ -282,39 +408,39 @@ def test_delete_already_deleted_object(asset1: SampleAsset):
         env.delete(asset1)
 
 
-def test_add_nested_lists(asset_list: list[SampleAsset], agent_list: list[SampleAgent]):
+def test_add_nested_lists(asset_pool: list[SampleAsset], agent_pool: list[SampleAgent]):
     """Test that nested lists of objects can be added using the add method."""
     env = Environment()
-    nested_objects = [asset_list, agent_list]
+    nested_objects = [asset_pool, agent_pool]
     env.add(nested_objects)
 
-    for asset in asset_list:
+    for asset in asset_pool:
         assert env.is_in(asset)
-    for agent in agent_list:
+    for agent in agent_pool:
         assert env.is_in(agent)
 
 
 def test_delete_nested_lists(
-    asset_list: list[SampleAsset], agent_list: list[SampleAgent]
+    asset_pool: list[SampleAsset], agent_pool: list[SampleAgent]
 ):
     """Test that nested lists of objects can be deleted using the delete method."""
     env = Environment()
-    nested_objects = [asset_list, agent_list]
+    nested_objects = [asset_pool, agent_pool]
     env.add(nested_objects)
 
     # Verify objects are registered
-    for asset in asset_list:
+    for asset in asset_pool:
         assert env.is_in(asset)
-    for agent in agent_list:
+    for agent in agent_pool:
         assert env.is_in(agent)
 
     # Delete using nested lists
     env.delete(nested_objects)
 
     # Verify objects are deleted
-    for asset in asset_list:
+    for asset in asset_pool:
         assert not env.is_in(asset)
-    for agent in agent_list:
+    for agent in agent_pool:
         assert not env.is_in(agent)
 
 
@@ -343,6 +469,27 @@ def test_add_mixed_nested_lists():
     agent2.destroy()
 
 
+def test_add_partially_nested_list(asset1: SampleAsset, agent1: SampleAgent):
+    """Test that objects next to nested lists are added as well."""
+    env = Environment()
+    env.add([[asset1], agent1])
+    assert env.is_in(asset1)
+    assert env.is_in(agent1)
+
+
+def test_add_deeply_nested_list(
+    asset_pool: list[SampleAsset], agent_pool: list[SampleAgent]
+):
+    """Test that lists nested at any depth are flattened in order."""
+    env = Environment()
+    env.add([asset_pool[0], [asset_pool[1], (asset_pool[2], [agent_pool])]])
+    assert list(env.assets.values()) == asset_pool
+    assert list(env.agents.values()) == agent_pool
+
+    env.delete([[[asset_pool]], agent_pool])
+    assert not env.get_list()
+
+
 def test_add_invalid_type():
     """Test that adding an invalid type raises a TypeError."""
     env = Environment()
@@ -355,3 +502,99 @@ def test_add_invalid_type():
 
     with pytest.raises(TypeError):
         env.add(None)
+
+
+def test_step_parallel():
+    """Test that agents act in worker processes and their state is merged back."""
+    agents = [ProcessAgent(id=f"parallel{i}") for i in range(4)]
+    shared = SharedProcessAgent(id="shared")
+    asset = SampleAsset(id="parallel")
+    with Environment(parallel=2) as env:
+        env.add(agents + [shared, asset])
+        env.step()
+        env.step()
+    assert env._pool is None
+
+    assert env.year == 2022
+    for a in agents:
+        assert a.n_acts == 2
+        assert a.pid != os.getpid()
+        assert env.get(a.id) is a
+        # workers see the year and the assets of the environment
+        assert a.seen_year == 2021
+        assert a.seen_assets == 1
+    # agents requiring shared state act in the main process
+    assert shared.n_acts == 2
+    assert shared.pid == os.getpid()
+    assert len(env.reports[ProcessAgent.__name__]) == 8
+
+    # clean up
+    for a in agents + [shared, asset]:
+        a.destroy()
+
+
+def test_step_threaded():
+    """Test that thread-safe agents prepare in threads and choose in the main thread."""
+    env = Environment()
+    main_thread = threading.get_ident()
+    calls: list[tuple[str, str, int]] = []
+
+    class ThreadedAgent(SampleAgent):
+        thread_safe: ClassVar[bool] = True
+
+        def perceive(self, environment):
+            calls.append(("perceive", self.id, threading.get_ident()))
+
+        def trigger_choice(self, perception):
+            return SampleChoiceSet()
+
+        def choose(self, options, perception):
+            calls.append(("choose", self.id, threading.get_ident()))
+
+    agents = [ThreadedAgent(id=f"threaded{i}") for i in range(4)]
+    env.add(agents)
+    env.step()
+
+    perceived = [c for c in calls if c[0] == "perceive"]
+    chosen = [c for c in calls if c[0] == "choose"]
+    assert {c[1] for c in perceived} == {a.id for a in agents}
+    assert all(c[2] != main_thread for c in perceived)
+    # choices are made in the main thread in the order of the agents
+    assert [c[1] for c in chosen] == [a.id for a in agents]
+    assert all(c[2] == main_thread for c in chosen)
+    env.close()
+
+    # clean up
+    for a in agents:
+        a.destroy()
+
+
+def test_step_order_mixed_agents():
+    """Test that serial and thread-safe agents choose in registration order."""
+    env = Environment()
+    chosen: list[str] = []
+
+    class SerialAgent(SampleAgent):
+        def trigger_choice(self, perception):
+            return SampleChoiceSet()
+
+        def choose(self, options, perception):
+            chosen.append(self.id)
+
+    class ThreadedAgent(SerialAgent):
+        thread_safe: ClassVar[bool] = True
+
+    agents = [
+        SerialAgent(id="order0"),
+        ThreadedAgent(id="order1"),
+        SerialAgent(id="order2"),
+        ThreadedAgent(id="order3"),
+    ]
+    env.add(agents)
+    env.step()
+    env.close()
+    assert chosen == [a.id for a in agents]
+
+    # clean up
+    for a in agents:
+        a.destroy()
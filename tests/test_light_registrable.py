@@ -0,0 +1,79 @@
+import pytest
+
+from cosi_consumer_framework import Environment, LightAgent, LightAsset
+
+
+class LightHouse(LightAsset):
+    __slots__ = ("area",)
+
+    def __init__(self, id: str, area: float):
+        super().__init__(id=id)
+        self.area = area
+
+
+class LightHousehold(LightAgent):
+    __slots__ = ("house_id", "n_acts")
+
+    def __init__(self, id: str, house_id: str):
+        super().__init__(id=id)
+        self.house_id = house_id
+        self.n_acts = 0
+
+    def act(self, environment):
+        self.n_acts += 1
+
+    def perceive(self, environment):
+        pass
+
+    def trigger_choice(self, perception):
+        pass
+
+    def choose(self, options, perception):
+        pass
+
+
+@pytest.fixture(scope="function")
+def light_house():
+    house = LightHouse(id="house1", area=100.0)
+    yield house
+    house.destroy()
+
+
+def test_light_registrable(light_house: LightHouse):
+    assert light_house.id == "LightHouse.house1"
+    assert light_house.class_name == "LightHouse"
+    assert light_house.is_active
+    assert not hasattr(light_house, "__dict__")
+    assert light_house.report() == {
+        "LightHouse": {"id": "LightHouse.house1", "area": 100.0}
+    }
+    with pytest.raises(ValueError):
+        LightHouse(id="house1", area=50.0)
+    with pytest.raises(ValueError):
+        LightHouse(id=" ", area=50.0)
+
+
+def test_light_registrable_destroy():
+    house = LightHouse(id="destroyed", area=1.0)
+    house.destroy()
+    assert house.id not in LightHouse._used_ids
+    assert not house.is_active
+
+
+def test_light_environment(light_house: LightHouse):
+    env = Environment()
+    household = LightHousehold(id="household1", house_id="LightHouse.missing")
+    env.add(light_house)
+    # fails as the referenced house is not registered
+    with pytest.raises(ValueError):
+        env.add(household)
+    household.house_id = light_house.id
+    env.add(household)
+
+    env.step()
+    assert household.n_acts == 1
+    assert env.get_list(LightHouse) == [light_house]
+    assert len(env.reports["LightHousehold"]) == 1
+
+    # clean up
+    household.destroy()
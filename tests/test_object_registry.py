@@ -2,7 +2,7 @@ import pytest
 
 from cosi_consumer_framework import ObjectRegistry, Registrable
 
-from .conftest import SampleAsset
+from .conftest import SampleAgent, SampleAsset
 
 
 def test_register_object(asset1: Registrable):
@@ -18,12 +18,29 @@ def test_register_object_duplicated(asset1: Registrable):
         registry.add(asset1)
 
 
-def test_objects_property(asset_list: list[Registrable]):
+def test_register_list_atomic(asset_pool: list[SampleAsset]):
     registry = ObjectRegistry()
-    registry.add(asset_list)
+    registry.add(asset_pool[0])
+    # nothing is registered if any object of the list is invalid
+    with pytest.raises(ValueError):
+        registry.add(asset_pool[1:] + [asset_pool[0]])
+    with pytest.raises(ValueError):
+        registry.add([asset_pool[1], asset_pool[1]])
+    assert list(registry.objects) == [asset_pool[0].id]
+
+
+def test_register_nested_tuples(asset_pool: list[SampleAsset]):
+    registry = ObjectRegistry()
+    registry.add([(asset_pool[0], [asset_pool[1]]), [[asset_pool[2]]]])
+    assert registry.list_objects() == asset_pool
+
+
+def test_objects_property(asset_pool: list[Registrable]):
+    registry = ObjectRegistry()
+    registry.add(asset_pool)
     objects = registry.objects
     assert isinstance(objects, dict)
-    assert len(objects) == len(asset_list)
+    assert len(objects) == len(asset_pool)
 
 
 def test_register_not_registrable():
@@ -38,26 +55,27 @@ def test_register_not_registrable():
         registry.add(obj1)
 
 
-def test_register_objects_list(asset_list: list[SampleAsset]):
+def test_register_objects_list(asset_pool: list[SampleAsset]):
     registry = ObjectRegistry()
-    registry.add(asset_list)
-    for obj in asset_list:
+    registry.add(asset_pool)
+    for obj in asset_pool:
         assert registry.objects[obj.id] == obj
 
 
-def test_delete_object(asset_list: list[SampleAsset]):
+def test_delete_object(asset_pool: list[SampleAsset]):
     registry = ObjectRegistry()
-    registry.add(asset_list)
-    obj1 = asset_list[0]
+    registry.add(asset_pool)
+    obj1 = asset_pool[0]
     assert obj1.id in registry.objects
     registry.delete(obj1)
     assert obj1.id not in registry.objects
+    assert obj1 not in registry.list_objects(SampleAsset)
 
 
-def test_object_is_registered(asset_list: list[SampleAsset]):
+def test_object_is_registered(asset_pool: list[SampleAsset]):
     registry = ObjectRegistry()
-    registry.add(asset_list)
-    obj1 = asset_list[0]
+    registry.add(asset_pool)
+    obj1 = asset_pool[0]
     assert registry.object_is_registered(obj1)
 
     class Foo:
@@ -67,10 +85,17 @@ def test_object_is_registered(asset_list: list[SampleAsset]):
     assert not registry.object_is_registered(Foo())
 
 
-def test_delete_non_existent_object(asset_list: list[SampleAsset]):
+def test_object_is_registered_by_id(asset_pool: list[SampleAsset]):
+    registry = ObjectRegistry()
+    registry.add(asset_pool)
+    assert registry.object_is_registered(asset_pool[0].id)
+    assert not registry.object_is_registered("SampleAsset.unknown")
+
+
+def test_delete_non_existent_object(asset_pool: list[SampleAsset]):
     registry = ObjectRegistry()
-    registry.add(asset_list)
-    obj1 = asset_list[0]
+    registry.add(asset_pool)
+    obj1 = asset_pool[0]
     registry.delete(obj1)
     with pytest.raises(KeyError):
         registry.delete(obj1)  # Attempt to delete an already deleted object
@@ -92,14 +117,14 @@ def test_is_active_not_registered(asset1: SampleAsset):
     asset1._is_active = True  # Reset to active for further tests
 
 
-def test_list_objects_by_class_name(asset_list: list[SampleAsset]):
+def test_list_objects_by_class_name(asset_pool: list[SampleAsset]):
     registry = ObjectRegistry()
-    registry.add(asset_list)
+    registry.add(asset_pool)
     class_name = SampleAsset.__name__
     objects = registry.list_objects(class_name)
     assert isinstance(objects, list)
     assert all(isinstance(obj, SampleAsset) for obj in objects)
-    assert len(objects) == len(asset_list)
+    assert len(objects) == len(asset_pool)
     # as we only have one registered object class, we should get the same
     # results without specifying the class name
     assert registry.list_objects() == objects
@@ -108,7 +133,7 @@ def test_list_objects_by_class_name(asset_list: list[SampleAsset]):
     objects = registry.list_objects("SampleAsset")
     assert isinstance(objects, list)
     assert all(isinstance(obj, SampleAsset) for obj in objects)
-    assert len(objects) == len(asset_list)
+    assert len(objects) == len(asset_pool)
 
     # Test with a non-existent class name
     non_existent_class_name = "NonExistentClass"
@@ -116,10 +141,33 @@ def test_list_objects_by_class_name(asset_list: list[SampleAsset]):
     assert objects == []  # Should return an empty list for non-existent class names
 
 
-def test_get_item(asset_list: list[SampleAsset]):
+def test_list_objects_mixed_classes(
+    asset_pool: list[SampleAsset], agent_pool: list[SampleAgent]
+):
+    registry = ObjectRegistry()
+    registry.add([asset_pool, agent_pool])
+    assert registry.list_objects(SampleAsset) == asset_pool
+    assert registry.list_objects(SampleAgent) == agent_pool
+
+    registry.delete(agent_pool)
+    assert registry.list_objects(SampleAgent) == []
+    assert "SampleAgent" not in registry._objects_by_class
+
+
+def test_list_objects_added_in_batches(
+    asset_pool: list[SampleAsset], agent_pool: list[SampleAgent]
+):
     registry = ObjectRegistry()
-    registry.add(asset_list)
-    obj1 = asset_list[0]
+    registry.add([asset_pool[0], agent_pool[0]])
+    registry.add([agent_pool[1:], asset_pool[1:]])
+    assert registry.list_objects(SampleAsset) == asset_pool
+    assert registry.list_objects(SampleAgent) == agent_pool
+
+
+def test_get_item(asset_pool: list[SampleAsset]):
+    registry = ObjectRegistry()
+    registry.add(asset_pool)
+    obj1 = asset_pool[0]
 
     # by id
     retrieved_obj = registry.get_item(
@@ -132,9 +180,13 @@ def test_get_item(asset_list: list[SampleAsset]):
         registry.get_item(id="non_existent_id")
 
     # non-existent but valid class name
-    with pytest.raises(ValueError):
+    with pytest.raises(ValueError, match="unknown class"):
         registry.get_item(id="nonExistant.id")
 
+    # registered class but non-existent ID
+    with pytest.raises(ValueError, match="not found in the registry.$"):
+        registry.get_item(id="SampleAsset.non_existent_id")
+
 
 def test_get_object_name_from_id(asset1: SampleAsset):
     registry = ObjectRegistry()
@@ -1,9 +1,15 @@
 import pytest
 
 import pandas as pd
-from pydantic import ValidationError
+from pydantic import (
+    ConfigDict,
+    Field,
+    ValidationError,
+    field_validator,
+    model_validator,
+)
 
-from .conftest import SampleAsset
+from .conftest import SampleAgent, SampleAsset
 from cosi_consumer_framework import Registrable
 
 
@@ -33,6 +39,24 @@ def test_registrable_destroy():
     assert not obj_test_destroy.is_active
 
 
+def test_registrable_destroy_many():
+    assets = [SampleAsset(id=f"destroy_many{i}") for i in range(3)]
+    agent = SampleAgent(id="destroy_many")
+    Registrable.destroy_many(assets + [agent])
+    assert not SampleAsset._used_ids.intersection(a.id for a in assets)
+    assert agent.id not in SampleAgent._used_ids
+    assert not any(o.is_active for o in assets + [agent])
+
+    # nothing is destroyed if any object is destroyed already
+    asset = SampleAsset(id="destroy_many0")
+    with pytest.raises(KeyError):
+        Registrable.destroy_many([asset, assets[1]])
+    with pytest.raises(KeyError):
+        Registrable.destroy_many([asset, asset])
+    assert asset.is_active
+    asset.destroy()
+
+
 def test_registrable_unique_by_class_id():
     class U1(Registrable):
         pass
@@ -45,11 +69,61 @@ def test_registrable_unique_by_class_id():
     _ = U2(id="unique1")
 
 
+def test_reference_fields():
+    class House(Registrable):
+        owner_id: str
+        heating_id: str | None = None
+        area: float = 0.0
+
+    class SmallHouse(House):
+        garden_id: str
+
+    # reference fields are collected once per class, including inherited ones
+    assert House._reference_fields == ("owner_id", "heating_id")
+    assert SmallHouse._reference_fields == ("owner_id", "heating_id", "garden_id")
+    assert SampleAsset._reference_fields == ()
+
+
 def test_report(asset1: Registrable):
     report = asset1.report()
     assert report[asset1.class_name] == asset1.model_dump()
 
 
+def test_report_generated():
+    class Plain(Registrable):
+        value: float = 1.0
+        label: str | None = None
+
+    class Nested(Plain):
+        values: list[int] = []
+
+    class Custom(Plain):
+        def report(self):
+            return {"custom": {}}
+
+    class CustomChild(Custom):
+        pass
+
+    # a report method is generated for plain fields only
+    plain = Plain(id="plain")
+    assert getattr(Plain.report, "_generated", False)
+    assert plain.report() == {"Plain": plain.model_dump()}
+    nested = Nested(id="nested", values=[1])
+    assert Nested.report is Registrable.report
+    assert nested.report() == {"Nested": nested.model_dump()}
+    # overridden report methods are kept
+    assert CustomChild(id="child").report() == {"custom": {}}
+
+    # extra fields are only known to model_dump
+    class Extra(Plain):
+        model_config = ConfigDict(extra="allow")  # type: ignore
+
+    extra = Extra(id="extra", b=2)
+    assert Extra.report is Registrable.report
+    assert extra.report() == {"Extra": extra.model_dump()}
+    assert extra.report()["Extra"]["b"] == 2
+
+
 def test_create_from_dataframe():
     asset_data = [
         {"id": "dataframe_asset1"},
@@ -65,3 +139,132 @@ def test_create_from_dataframe():
         assert isinstance(a, SampleAsset)
         assert a.id == f"SampleAsset.{id_}"
         a.destroy()
+
+
+@pytest.mark.parametrize("validate", [False, True])
+def test_create_from_dataframe_duplicated(validate: bool, asset1: SampleAsset):
+    # duplicated within the DataFrame
+    df_assets = pd.DataFrame([{"id": "df_dup"}, {"id": "df_dup"}])
+    with pytest.raises(ValueError):
+        SampleAsset.create_from_dataframe(df_assets, validate=validate)
+    SampleAsset._used_ids.discard("SampleAsset.df_dup")
+
+    # duplicated with an existing object
+    df_assets = pd.DataFrame([{"id": asset1.id.split(".")[-1]}])
+    with pytest.raises(ValueError):
+        SampleAsset.create_from_dataframe(df_assets, validate=validate)
+
+
+def test_create_from_dataframe_missing_field():
+    class SizedAsset(Registrable):
+        size: float
+
+    # rows without a required field are validated and rejected
+    with pytest.raises(ValueError):
+        SizedAsset.create_from_dataframe(pd.DataFrame([{"id": "sized1"}]))
+    assert not SizedAsset._used_ids
+
+    assets = SizedAsset.create_from_dataframe(
+        pd.DataFrame([{"id": "sized1", "size": 2.0}])
+    )
+    assert assets[0].size == 2.0
+
+
+def test_create_from_dataframe_invalid_values():
+    class LabeledAsset(Registrable):
+        size: float
+        label: str | None = None
+
+    # values not matching the type of their field are validated and rejected
+    with pytest.raises(ValueError):
+        LabeledAsset.create_from_dataframe(
+            pd.DataFrame([{"id": "labeled1", "size": "abc"}])
+        )
+    with pytest.raises(ValueError):
+        LabeledAsset.create_from_dataframe(
+            pd.DataFrame(
+                [
+                    {"id": "labeled1", "size": 1.0, "label": "a"},
+                    {"id": "labeled2", "size": 1.0, "label": float("nan")},
+                ]
+            )
+        )
+    assert not LabeledAsset._used_ids
+
+    # values converted by the validation are validated
+    assets = LabeledAsset.create_from_dataframe(
+        pd.DataFrame([{"id": "labeled1", "size": 2, "label": None}])
+    )
+    assert isinstance(assets[0].size, float)
+    assert assets[0].label is None
+
+
+def test_create_from_dataframe_constraint():
+    class ConstrainedAsset(Registrable):
+        size: float = Field(gt=0)
+
+    with pytest.raises(ValidationError):
+        ConstrainedAsset(id="constrained1", size=-5.0)
+    with pytest.raises(ValidationError, match="greater than 0"):
+        ConstrainedAsset.create_from_dataframe(
+            pd.DataFrame([{"id": "constrained1", "size": -5.0}])
+        )
+    assert not ConstrainedAsset._used_ids
+
+
+def test_create_from_dataframe_field_validator():
+    class NamedAsset(Registrable):
+        name: str
+
+        @field_validator("name")
+        @classmethod
+        def _validate_name(cls, v: str) -> str:
+            if not v.isalpha():
+                raise ValueError("name must only contain letters")
+            return v.upper()
+
+    with pytest.raises(ValidationError):
+        NamedAsset(id="named1", name="a1")
+    with pytest.raises(ValidationError, match="only contain letters"):
+        NamedAsset.create_from_dataframe(pd.DataFrame([{"id": "named1", "name": "a1"}]))
+    assets = NamedAsset.create_from_dataframe(
+        pd.DataFrame([{"id": "named1", "name": "abc"}])
+    )
+    assert assets[0].name == "ABC"
+
+
+def test_create_from_dataframe_model_validator():
+    class RangeAsset(Registrable):
+        low: float
+        high: float
+
+        @model_validator(mode="after")
+        def _validate_range(self) -> "RangeAsset":
+            if self.low > self.high:
+                raise ValueError("low must not exceed high")
+            return self
+
+    with pytest.raises(ValidationError):
+        RangeAsset(id="range1", low=2.0, high=1.0)
+    with pytest.raises(ValidationError, match="low must not exceed high"):
+        RangeAsset.create_from_dataframe(
+            pd.DataFrame([{"id": "range2", "low": 2.0, "high": 1.0}])
+        )
+
+
+def test_bulk_register_ids(asset1: SampleAsset):
+    ids = SampleAsset.bulk_register_ids(["bulk1", "bulk2"])
+    assert ids == ["SampleAsset.bulk1", "SampleAsset.bulk2"]
+    assert SampleAsset._used_ids.issuperset(ids)
+
+    # nothing is registered if any of the IDs is invalid
+    with pytest.raises(ValueError, match="bulk1.*obj1"):
+        SampleAsset.bulk_register_ids(["bulk3", "bulk1", "obj1"])
+    with pytest.raises(ValueError, match="bulk4"):
+        SampleAsset.bulk_register_ids(["bulk4", "bulk4"])
+    with pytest.raises(ValueError):
+        SampleAsset.bulk_register_ids(["bulk5", ""])
+    assert not SampleAsset._used_ids.intersection(
+        ["SampleAsset.bulk3", "SampleAsset.bulk4", "SampleAsset.bulk5"]
+    )
+    SampleAsset._used_ids.difference_update(ids)
@@ -0,0 +1,67 @@
+import numpy as np
+
+from cosi_consumer_framework.report_buffer import ReportBuffer
+
+
+def test_numeric_columns_are_arrays():
+    buffer = ReportBuffer(capacity=2)
+    for i in range(5):
+        buffer.append({"id": f"obj{i}", "value": i * 0.5, "count": i, "flag": True})
+
+    assert len(buffer) == 5
+    columns = buffer.columns()
+    assert isinstance(columns["id"], list)
+    assert isinstance(columns["value"], np.ndarray)
+    assert columns["count"].dtype == np.int64
+    assert columns["flag"].dtype == np.bool_
+    assert columns["value"].tolist() == [0.0, 0.5, 1.0, 1.5, 2.0]
+    assert buffer.rows()[1] == {"id": "obj1", "value": 0.5, "count": 1, "flag": True}
+
+
+def test_mismatching_values_convert_to_list():
+    buffer = ReportBuffer()
+    buffer.append({"value": 1.0, "count": 1})
+    buffer.append({"value": "high", "count": 2**70})
+    buffer.append({"value": 2.0})
+
+    columns = buffer.columns()
+    assert columns["value"] == [1.0, "high", 2.0]
+    assert columns["count"] == [1, 2**70, None]
+
+
+def test_reserve_keeps_values():
+    buffer = ReportBuffer(capacity=1)
+    buffer.append({"value": 1.0})
+    buffer.reserve(100)
+    buffer.append({"value": 2.0})
+    assert buffer.columns()["value"].tolist() == [1.0, 2.0]
+    assert buffer.to_dataframe()["value"].tolist() == [1.0, 2.0]
+
+
+def test_dataframe_is_copied():
+    buffer = ReportBuffer()
+    buffer.append({"value": 1.0, "label": "a"})
+    df = buffer.to_dataframe()
+    df.loc[0, "value"] = 5.0
+    df.loc[0, "label"] = "b"
+    assert buffer.rows() == [{"value": 1.0, "label": "a"}]
+
+
+def test_rows_are_extended():
+    buffer = ReportBuffer()
+    buffer.append({"value": 1.0})
+    rows = buffer.rows()
+    assert rows == [{"value": 1.0}]
+
+    # rows of earlier calls are kept and new reports are appended
+    buffer.append({"value": 2.0})
+    assert buffer.rows() is rows
+    assert rows == [{"value": 1.0}, {"value": 2.0}]
+
+    # a new field rebuilds all rows
+    buffer.append({"value": 3.0, "label": "a"})
+    assert buffer.rows() == [
+        {"value": 1.0, "label": None},
+        {"value": 2.0, "label": None},
+        {"value": 3.0, "label": "a"},
+    ]
@@ -1,6 +1,20 @@
-from cosi_consumer_framework.utils import discounted_sum
+import numpy as np
+import pytest
+
+from cosi_consumer_framework.utils import discounted_sum, discounted_sum_array
 
 
 def test_discounted_sum():
     assert discounted_sum([1] * 5, 0.9) == 4.0951
     assert round(discounted_sum([1] * 5, 0.9, 5), 6) == 2.418116
+
+
+def test_discounted_sum_long():
+    values = [float(i) for i in range(100)]
+    expected = sum(v * 0.95 ** (i + 2) for i, v in enumerate(values))
+    assert discounted_sum(values, 0.95, 2) == pytest.approx(expected)
+    assert discounted_sum_array(np.array(values), 0.95, 2) == pytest.approx(expected)
+
+
+def test_discounted_sum_array_input():
+    assert discounted_sum(np.ones(5), 0.9) == pytest.approx(4.0951)
@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+
+from cosi_consumer_framework import Environment, VectorizedAgentGroup
+
+
+def adoption_step(state, environment_state):
+    """Agents adopt if their willingness to pay exceeds the price of the year."""
+    price = 10 - 2 * (environment_state["year"] - 2020)
+    choices = state["willingness_to_pay"] > price
+    adopted = state["adopted"] | choices
+    return {**state, "adopted": adopted}, choices
+
+
+def test_vectorized_agent_group():
+    env = Environment(year=2020)
+    group = VectorizedAgentGroup(
+        name="households",
+        state={
+            "willingness_to_pay": np.array([5.0, 8.5, 12.0]),
+            "adopted": np.zeros(3, dtype=bool),
+        },
+        step_fn=adoption_step,
+    )
+    env.add_group(group)
+    assert len(group) == 3
+    assert env.groups["households"] is group
+
+    env.step()
+    assert group.choices.tolist() == [False, False, True]
+    env.step()
+    assert group.choices.tolist() == [False, True, True]
+    assert group.state["adopted"].tolist() == [False, True, True]
+
+    with pytest.raises(ValueError):
+        env.add_group(group)
+
+
+def test_vectorized_agent_group_state_length():
+    with pytest.raises(ValueError):
+        VectorizedAgentGroup(
+            name="invalid",
+            state={"a": np.zeros(2), "b": np.zeros(3)},
+            step_fn=adoption_step,
+        )